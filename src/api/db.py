@@ -0,0 +1,152 @@
+"""SQLite helpers for the notes API.
+
+Connections are pooled at module level rather than opened per request:
+short queries are dominated by connection setup cost, so handlers borrow
+a pre-opened connection and return it when done.
+
+Under WAL, SQLite allows many concurrent readers but only one writer, so
+reads come from a pool (``borrow_read``) while all writes are funneled
+through a single lock-guarded connection (``borrow_write``). Serializing
+writes in-process avoids SQLITE_BUSY retries at the busy-handler level.
+"""
+
+import asyncio
+import os
+import queue
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_READ_POOL_SIZE = 8
+_READ_POOL: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=_READ_POOL_SIZE)
+_created = 0
+_created_lock = threading.Lock()
+
+_WRITE_CONN: "sqlite3.Connection | None" = None
+_WRITE_LOCK = threading.Lock()
+
+# Handlers are async so the event loop stays free; the blocking sqlite3
+# calls run on this dedicated executor instead of Starlette's shared
+# 40-thread pool.
+_DB_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix="notes-db"
+)
+
+
+async def run_in_db_thread(fn: Callable[[], T]) -> T:
+    """Run a blocking database function on the DB executor."""
+    return await asyncio.get_running_loop().run_in_executor(_DB_EXECUTOR, fn)
+
+
+def _resolve_db_path() -> str:
+    """Resolve the SQLite database file path from the environment."""
+    path = os.path.abspath(os.getenv("NOTES_DB_PATH", "notes.db"))
+    parent = os.path.dirname(path)
+    if not os.path.exists(parent):
+        os.makedirs(parent, exist_ok=True)
+    return path
+
+
+# Resolved once at import: the path cannot change at runtime, so the
+# getenv/abspath/stat work should not repeat on every new connection.
+_DB_PATH = _resolve_db_path()
+
+
+def _new_connection() -> sqlite3.Connection:
+    # Connections live for the process lifetime, so a larger per-connection
+    # statement cache stays warm across requests.
+    conn = sqlite3.connect(_DB_PATH, check_same_thread=False, cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    # journal_mode=WAL is persisted in the database file, but the other
+    # pragmas are per-connection and must be applied to every new one.
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    conn.execute("PRAGMA cache_size = -65536")
+    conn.execute("PRAGMA busy_timeout = 5000")
+    return conn
+
+
+@contextmanager
+def borrow_read() -> Iterator[sqlite3.Connection]:
+    """Borrow a read connection from the pool, creating one lazily if the
+    pool has not reached its size limit yet."""
+    global _created
+    conn = None
+    try:
+        conn = _READ_POOL.get_nowait()
+    except queue.Empty:
+        with _created_lock:
+            if _created < _READ_POOL_SIZE:
+                _created += 1
+                conn = _new_connection()
+    if conn is None:
+        conn = _READ_POOL.get()
+    try:
+        yield conn
+    finally:
+        _READ_POOL.put(conn)
+
+
+@contextmanager
+def borrow_write() -> Iterator[sqlite3.Connection]:
+    """Borrow the single write connection, serializing writers in-process."""
+    global _WRITE_CONN
+    with _WRITE_LOCK:
+        if _WRITE_CONN is None:
+            _WRITE_CONN = _new_connection()
+        yield _WRITE_CONN
+
+
+def close_pool() -> None:
+    """Close every pooled connection. Called on application shutdown."""
+    global _created, _DB_EXECUTOR, _WRITE_CONN
+    _DB_EXECUTOR.shutdown(wait=True)
+    # Replace the executor so the application can be restarted in-process
+    # (e.g. across test client lifespans).
+    _DB_EXECUTOR = ThreadPoolExecutor(
+        max_workers=os.cpu_count() or 4, thread_name_prefix="notes-db"
+    )
+    while True:
+        try:
+            conn = _READ_POOL.get_nowait()
+        except queue.Empty:
+            break
+        conn.close()
+    with _created_lock:
+        _created = 0
+    with _WRITE_LOCK:
+        if _WRITE_CONN is not None:
+            _WRITE_CONN.close()
+            _WRITE_CONN = None
+
+
+# updated_at is maintained by the UPDATE statements themselves; the old
+# notes_set_updated_at trigger rewrote each updated row's page a second
+# time, so it is dropped from existing databases.
+_SCHEMA_DDL = """
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL DEFAULT '',
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_notes_updated_at
+    ON notes(updated_at DESC, id DESC);
+DROP TRIGGER IF EXISTS notes_set_updated_at;
+COMMIT;
+"""
+
+
+def ensure_schema() -> None:
+    """Create the notes table and index if they do not exist."""
+    with borrow_write() as conn:
+        conn.executescript(_SCHEMA_DDL)
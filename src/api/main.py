@@ -0,0 +1,66 @@
+"""Application entry point for the simple notes API."""
+
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from .db import borrow_write, close_pool, ensure_schema, run_in_db_thread
+from .notes import router as notes_router
+
+_MAINTENANCE_INTERVAL_SECONDS = 15 * 60
+
+
+async def _maintenance_loop() -> None:
+    """Periodically checkpoint the WAL and refresh planner statistics.
+
+    Running these off the request path keeps SQLite's automatic
+    ~1000-page checkpoint from landing inside an unlucky write request.
+    """
+
+    def maintain() -> None:
+        with borrow_write() as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            conn.execute("PRAGMA optimize")
+
+    while True:
+        await asyncio.sleep(_MAINTENANCE_INTERVAL_SECONDS)
+        await run_in_db_thread(maintain)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    ensure_schema()
+    maintenance_task = asyncio.create_task(_maintenance_loop())
+    yield
+    maintenance_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await maintenance_task
+    close_pool()
+
+
+app = FastAPI(
+    title="Simple Notes API",
+    description="A minimal note-taking REST API backed by SQLite.",
+    version="0.1.0",
+    lifespan=lifespan,
+)
+
+# allow_credentials stays False: combined with a wildcard origin it is
+# invalid CORS anyway, and False lets Starlette send a precomputed
+# "access-control-allow-origin: *" instead of echoing each origin back.
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+app.include_router(notes_router)
+
+
+@app.get("/", tags=["health"])
+def health() -> dict:
+    """Liveness check."""
+    return {"status": "ok"}
@@ -0,0 +1,66 @@
+"""Pydantic models for the notes API."""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class NoteBase(BaseModel):
+    # extra="forbid" rejects unknown fields with a generated early check
+    # instead of merging them; frozen=True lets pydantic skip the
+    # setattr validator machinery entirely.
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    title: str = Field(..., min_length=1, max_length=200, description="Note title")
+    content: str = Field("", description="Note body text")
+
+
+class NoteCreate(NoteBase):
+    """Payload for creating a note."""
+
+
+class NoteUpdate(BaseModel):
+    """Payload for partially updating a note; omitted fields are left unchanged."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    title: Optional[str] = Field(None, min_length=1, max_length=200)
+    content: Optional[str] = None
+
+
+class NoteOut(NoteBase):
+    """A note as returned by the API."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True, from_attributes=True)
+
+    id: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class NoteCursor(BaseModel):
+    """Keyset-pagination cursor pointing at the last note of a page.
+
+    ``updated_at`` is the raw stored timestamp text so clients can echo it
+    back verbatim as ``after_updated_at``.
+    """
+
+    updated_at: str
+    id: int
+
+
+class NoteListPage(BaseModel):
+    """One page of notes plus the cursor for fetching the next page."""
+
+    items: List[NoteOut]
+    next_cursor: Optional[NoteCursor] = None
+
+
+class BulkCreateResult(BaseModel):
+    """Id range assigned by a bulk import; ids are contiguous because the
+    single write connection serializes inserts."""
+
+    first_id: int
+    last_id: int
+    count: int
@@ -0,0 +1,24 @@
+import os
+import tempfile
+
+import pytest
+
+# The DB path must be set before the application modules are imported.
+_tmpdir = tempfile.mkdtemp(prefix="notes-test-")
+os.environ["NOTES_DB_PATH"] = os.path.join(_tmpdir, "notes-test.db")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.api import db, notes  # noqa: E402
+from src.api.main import app  # noqa: E402
+
+
+@pytest.fixture()
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+    notes._NOTE_CACHE.clear()
+    with db.borrow_write() as conn:
+        conn.execute("DELETE FROM notes")
+        conn.execute("DELETE FROM sqlite_sequence WHERE name = 'notes'")
+        conn.commit()
@@ -0,0 +1,123 @@
+def _create(client, title="A note", content="Hello"):
+    response = client.post("/notes", json={"title": title, "content": content})
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_health(client):
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+def test_create_note(client):
+    note = _create(client, title="First", content="Body")
+    assert note["title"] == "First"
+    assert note["content"] == "Body"
+    assert note["id"] == 1
+    assert note["created_at"]
+    assert note["updated_at"]
+
+
+def test_create_note_rejects_empty_title(client):
+    response = client.post("/notes", json={"title": "", "content": "x"})
+    assert response.status_code == 422
+
+
+def test_get_note(client):
+    note = _create(client)
+    response = client.get(f"/notes/{note['id']}")
+    assert response.status_code == 200
+    assert response.json() == note
+
+
+def test_get_note_missing(client):
+    response = client.get("/notes/999")
+    assert response.status_code == 404
+
+
+def test_list_notes_newest_first(client):
+    for i in range(3):
+        _create(client, title=f"Note {i}")
+    response = client.get("/notes")
+    assert response.status_code == 200
+    page = response.json()
+    assert [n["title"] for n in page["items"]] == ["Note 2", "Note 1", "Note 0"]
+    assert page["next_cursor"] is None
+
+
+def test_list_notes_keyset_pagination(client):
+    for i in range(5):
+        _create(client, title=f"Note {i}")
+    seen = []
+    params = {"limit": 2}
+    while True:
+        page = client.get("/notes", params=params).json()
+        seen.extend(n["title"] for n in page["items"])
+        if page["next_cursor"] is None:
+            break
+        params = {
+            "limit": 2,
+            "after_updated_at": page["next_cursor"]["updated_at"],
+            "after_id": page["next_cursor"]["id"],
+        }
+    assert seen == [f"Note {i}" for i in reversed(range(5))]
+
+
+def test_list_notes_partial_cursor_rejected(client):
+    response = client.get("/notes", params={"after_id": 1})
+    assert response.status_code == 400
+
+
+def test_update_note(client):
+    note = _create(client, title="Old", content="Old body")
+    response = client.put(f"/notes/{note['id']}", json={"title": "New"})
+    assert response.status_code == 200
+    updated = response.json()
+    assert updated["title"] == "New"
+    assert updated["content"] == "Old body"
+
+
+def test_get_note_fresh_after_update(client):
+    note = _create(client, title="Old")
+    client.get(f"/notes/{note['id']}")  # warm the cache
+    client.put(f"/notes/{note['id']}", json={"title": "New"})
+    assert client.get(f"/notes/{note['id']}").json()["title"] == "New"
+
+
+def test_update_note_missing(client):
+    response = client.put("/notes/999", json={"title": "New"})
+    assert response.status_code == 404
+
+
+def test_update_note_no_fields(client):
+    note = _create(client)
+    response = client.put(f"/notes/{note['id']}", json={})
+    assert response.status_code == 400
+
+
+def test_bulk_create_notes(client):
+    payload = [{"title": f"Imported {i}", "content": ""} for i in range(3)]
+    response = client.post("/notes/bulk", json=payload)
+    assert response.status_code == 201
+    result = response.json()
+    assert result == {"first_id": 1, "last_id": 3, "count": 3}
+    page = client.get("/notes").json()
+    assert len(page["items"]) == 3
+
+
+def test_bulk_create_notes_empty(client):
+    response = client.post("/notes/bulk", json=[])
+    assert response.status_code == 400
+
+
+def test_delete_note(client):
+    note = _create(client)
+    response = client.delete(f"/notes/{note['id']}")
+    assert response.status_code == 204
+    assert client.get(f"/notes/{note['id']}").status_code == 404
+
+
+def test_delete_note_missing(client):
+    response = client.delete("/notes/999")
+    assert response.status_code == 404